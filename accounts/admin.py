@@ -1,4 +1,3 @@
-import hashlib
 import secrets
 
 from django.conf import settings
@@ -78,7 +77,7 @@ class UserAdmin(BaseUserAdmin):
 
             # Generate secure token for first login
             token = secrets.token_urlsafe(32)
-            obj.first_login_token = hashlib.sha256(token.encode()).hexdigest()
+            obj.first_login_token = User.hash_first_login_token(token)
             obj.is_invited = True
 
             # Save user first
@@ -149,7 +148,7 @@ Das Timelog-Team
             if user.first_login_token:
                 # Generate new token
                 token = secrets.token_urlsafe(32)
-                user.first_login_token = hashlib.sha256(token.encode()).hexdigest()
+                user.first_login_token = User.hash_first_login_token(token)
                 user.save()
 
                 self.send_invitation_email(user, token, request.user)
@@ -190,14 +190,10 @@ class MonthlyCalendar:
             self.days.append(day)
             current_date += timedelta(days=1)
 
-        # Load time entries for this month with vehicle usage data
-        time_entries = (
-            TimeEntry.objects.filter(
-                user=self.user, date__gte=month_start, date__lte=month_end
-            )
-            .select_related("user")
-            .prefetch_related("vehicleusage__vehicle")
-        )
+        # Load time entries for this month with vehicle usage data (one JOIN)
+        time_entries = TimeEntry.objects.filter(
+            user=self.user, date__gte=month_start, date__lte=month_end
+        ).select_related("user", "vehicleusage__vehicle")
 
         time_entries_by_date = {entry.date: entry for entry in time_entries}
 
@@ -172,9 +172,10 @@ class TimeEntryForm(forms.ModelForm):
                 self.fields["vehicle"].initial = self.user.default_vehicle
 
         # For editing existing entries, populate vehicle usage data
+        # (reuses the relation if the caller select_related() it)
         if self.instance.pk:
             try:
-                vehicle_usage = VehicleUsage.objects.get(time_entry=self.instance)
+                vehicle_usage = self.instance.vehicleusage
                 self.fields["vehicle"].initial = vehicle_usage.vehicle
                 self.fields["no_vehicle_used"].initial = vehicle_usage.no_vehicle_used
                 self.fields["start_kilometers"].initial = vehicle_usage.start_kilometers
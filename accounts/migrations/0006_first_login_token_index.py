@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_add_fuel_receipt_model"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="first_login_token",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                max_length=64,
+                null=True,
+                verbose_name="Erstanmeldung Token",
+            ),
+        ),
+    ]
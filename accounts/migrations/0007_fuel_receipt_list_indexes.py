@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_first_login_token_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="fuelreceipt",
+            index=models.Index(
+                fields=["employee", "vehicle", "-receipt_date"],
+                name="fuelreceipt_emp_veh_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="fuelreceipt",
+            index=models.Index(
+                fields=["employee", "status", "-receipt_date"],
+                name="fuelreceipt_emp_stat_date_idx",
+            ),
+        ),
+    ]
@@ -1,3 +1,5 @@
+import hashlib
+
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.db import models
@@ -23,7 +25,11 @@ class User(AbstractUser):
     is_invited = models.BooleanField(default=False, verbose_name="Eingeladen")
 
     first_login_token = models.CharField(
-        max_length=64, blank=True, null=True, verbose_name="Erstanmeldung Token"
+        max_length=64,
+        blank=True,
+        null=True,
+        db_index=True,
+        verbose_name="Erstanmeldung Token",
     )
 
     # Vehicle assignment (will be populated after Vehicle model is created)
@@ -43,6 +49,11 @@ class User(AbstractUser):
     def __str__(self):
         return f"{self.get_full_name()} ({self.get_role_display()})"
 
+    @staticmethod
+    def hash_first_login_token(token):
+        """Return the hex SHA-256 digest stored in first_login_token."""
+        return hashlib.sha256(token.encode()).hexdigest()
+
     @property
     def is_backoffice(self):
         """Check if user has backoffice role."""
@@ -65,6 +76,8 @@ class TimeEntry(models.Model):
         (2, "Mittel"),
         (3, "Hoch"),
     ]
+    # Label lookup built once at class creation for get_pollution_level_display()
+    POLLUTION_DISPLAY = dict(POLLUTION_CHOICES)
 
     user = models.ForeignKey(
         User,
@@ -152,6 +165,12 @@ class TimeEntry(models.Model):
     def __str__(self):
         return f"{self.user.get_full_name()} - {self.date}"
 
+    def get_pollution_level_display(self):
+        """Return the pollution level label from the precomputed lookup."""
+        return str(
+            self.POLLUTION_DISPLAY.get(self.pollution_level, self.pollution_level)
+        )
+
     def clean(self):
         """Validate the time entry data."""
         super().clean()
@@ -174,8 +193,13 @@ class TimeEntry(models.Model):
         if self.date and self.date > timezone.now().date():
             raise ValidationError({"date": "Datum kann nicht in der Zukunft liegen."})
 
-    def save(self, *args, **kwargs):
-        self.clean()
+    def save(self, *args, skip_validation=False, **kwargs):
+        """
+        Save the entry, running clean() first unless skip_validation is set.
+        Only skip validation for data that is already known to be valid.
+        """
+        if not skip_validation:
+            self.clean()
         super().save(*args, **kwargs)
 
     @property
@@ -459,6 +483,9 @@ class Vehicle(models.Model):
         ("other", "Sonstiges"),
     ]
 
+    # Columns needed to render a vehicle as a filter dropdown option
+    DROPDOWN_FIELDS = ("id", "license_plate", "make", "model")
+
     license_plate = models.CharField(
         max_length=20,
         unique=True,
@@ -799,6 +826,19 @@ class FuelReceipt(models.Model):
         verbose_name = "Tankbeleg"
         verbose_name_plural = "Tankbelege"
         ordering = ["-receipt_date"]
+        indexes = [
+            # Serve fuel_receipt_list's vehicle/status filters and newest-first
+            # ordering from one index range scan (the vehicle one also covers
+            # the EXISTS check behind the vehicle filter dropdown)
+            models.Index(
+                fields=["employee", "vehicle", "-receipt_date"],
+                name="fuelreceipt_emp_veh_date_idx",
+            ),
+            models.Index(
+                fields=["employee", "status", "-receipt_date"],
+                name="fuelreceipt_emp_stat_date_idx",
+            ),
+        ]
         constraints = [
             models.CheckConstraint(
                 check=models.Q(fuel_amount_liters__gte=0),
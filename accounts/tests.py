@@ -1,21 +1,72 @@
 import hashlib
+import logging
 import os
-from datetime import date, time
+from datetime import date, time, timedelta
+from unittest import mock
 
+from axes.helpers import get_cache, get_client_cache_keys
+from axes.models import AccessAttempt
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, make_password
+from django.contrib.auth.tokens import default_token_generator
 from django.core import mail
+from django.core.cache import caches
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
-from django.test import Client, TestCase
+from django.db import IntegrityError, connection
+from django.db.models import QuerySet
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils.encoding import force_bytes
+from django.utils.http import urlencode, urlsafe_base64_encode
 
 from .forms import TimeEntryForm, FuelReceiptForm
 from .models import TimeEntry, Vehicle, VehicleUsage, FuelReceipt
 
-User = get_user_model()
+try:
+    import pytest
+except ImportError:  # `manage.py test` fallback runs without pytest
+    pytest = None
 
+User = get_user_model()
 
-class DatabaseConfigurationTest(TestCase):
+# Marks tests skipped by `make test-fast`; a no-op without pytest
+slow = pytest.mark.slow if pytest else (lambda test: test)
+
+# Static URLs resolved once at import instead of on every test
+HOME_URL = reverse("home")
+LOGIN_URL = reverse("accounts:login")
+LOGOUT_URL = reverse("accounts:logout")
+LOCKED_URL = reverse("accounts:locked")
+PASSWORD_RESET_URL = reverse("accounts:password_reset")
+PASSWORD_RESET_DONE_URL = reverse("accounts:password_reset_done")
+PASSWORD_RESET_COMPLETE_URL = reverse("accounts:password_reset_complete")
+CREATE_EMPLOYEE_URL = reverse("accounts:create_employee")
+TIME_ENTRY_LIST_URL = reverse("accounts:time_entry_list")
+TIME_ENTRY_CREATE_URL = reverse("accounts:time_entry_create")
+TIME_ENTRY_CALENDAR_URL = reverse("accounts:time_entry_calendar")
+FUEL_RECEIPT_LIST_URL = reverse("accounts:fuel_receipt_list")
+FUEL_RECEIPT_CREATE_URL = reverse("accounts:fuel_receipt_create")
+ADMIN_USER_CHANGELIST_URL = reverse("admin:accounts_user_changelist")
+ADMIN_USER_ADD_URL = reverse("admin:accounts_user_add")
+ADMIN_TIMEENTRY_CHANGELIST_URL = reverse("admin:accounts_timeentry_changelist")
+
+
+class ContentAssertionsMixin:
+    """Assertion helpers for checking many substrings in one response."""
+
+    def assertAllContain(self, response, *needles):
+        """Assert that every needle occurs in the raw response bytes."""
+        content = response.content
+        missing = [
+            needle
+            for needle in needles
+            if needle.encode(response.charset) not in content
+        ]
+        self.assertFalse(missing, f"Missing from response: {missing}")
+
+
+class DatabaseConfigurationTest(SimpleTestCase):
     """Test database configuration per US-E01 requirements."""
 
     def test_database_configuration_sqlite_for_dev(self):
@@ -46,6 +97,10 @@ class DatabaseConfigurationTest(TestCase):
             )
             self.assertIn("postgresql", settings.DATABASES["default"]["ENGINE"])
 
+
+class DatabaseMigrationTest(TestCase):
+    """Test that the schema works on the configured database (US-E01)."""
+
     def test_migrations_work_on_current_database(self):
         """Test that migrations work on the current database engine."""
         from django.db import connection
@@ -118,15 +173,16 @@ class UserModelTest(TestCase):
 class TimeEntryModelTest(TestCase):
     """Test the TimeEntry model."""
 
-    def setUp(self):
-        self.employee = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.employee = User.objects.create_user(
             username="employee",
             email="employee@example.com",
             first_name="Test",
             last_name="Employee",
             role="employee",
         )
-        self.backoffice = User.objects.create_user(
+        cls.backoffice = User.objects.create_user(
             username="backoffice",
             email="backoffice@example.com",
             first_name="Back",
@@ -134,6 +190,7 @@ class TimeEntryModelTest(TestCase):
             role="backoffice",
         )
 
+    def setUp(self):
         self.time_entry_data = {
             "user": self.employee,
             "date": date(2024, 1, 15),
@@ -174,6 +231,72 @@ class TimeEntryModelTest(TestCase):
         with self.assertRaises(IntegrityError):
             TimeEntry.objects.create(**self.time_entry_data)
 
+    def test_pollution_level_choices(self):
+        """Test pollution level choices."""
+        # Test all valid pollution levels, inserted in one query (known-valid
+        # data, so skipping clean() via bulk_create is fine)
+        entries = TimeEntry.objects.bulk_create(
+            [
+                TimeEntry(
+                    **{
+                        **self.time_entry_data,
+                        "pollution_level": level,
+                        # Different dates to avoid unique constraint
+                        "date": date(2024, 1, 15 + level),
+                    }
+                )
+                for level, _ in TimeEntry.POLLUTION_CHOICES
+            ]
+        )
+        for entry, (level, description) in zip(entries, TimeEntry.POLLUTION_CHOICES):
+            self.assertEqual(entry.pollution_level, level)
+            self.assertEqual(entry.get_pollution_level_display(), description)
+
+    def test_save_skip_validation(self):
+        """Test that save(skip_validation=True) bypasses clean()."""
+        self.time_entry_data["date"] = date(9999, 12, 31)  # Rejected by clean()
+
+        entry = TimeEntry(**self.time_entry_data)
+        entry.save(skip_validation=True)
+
+        self.assertTrue(TimeEntry.objects.filter(pk=entry.pk).exists())
+
+
+class TimeEntryValidationTest(SimpleTestCase):
+    """Test TimeEntry validation and calculations that never touch the database."""
+
+    databases = set()
+
+    def setUp(self):
+        # Unsaved users are enough here: clean() and the work time
+        # properties only look at the entry's own fields.
+        self.employee = User(
+            username="employee",
+            email="employee@example.com",
+            first_name="Test",
+            last_name="Employee",
+            role="employee",
+        )
+        self.backoffice = User(
+            username="backoffice",
+            email="backoffice@example.com",
+            first_name="Back",
+            last_name="Office",
+            role="backoffice",
+        )
+
+        self.time_entry_data = {
+            "user": self.employee,
+            "date": date(2024, 1, 15),
+            "start_time": time(9, 0),
+            "end_time": time(17, 0),
+            "lunch_break_minutes": 30,
+            "pollution_level": 2,
+            "notes": "Test entry",
+            "created_by": self.backoffice,
+            "updated_by": self.backoffice,
+        }
+
     def test_validation_end_time_after_start_time(self):
         """Test that end time must be after start time during normal hours."""
         self.time_entry_data.update(
@@ -184,47 +307,34 @@ class TimeEntryModelTest(TestCase):
         )
 
         entry = TimeEntry(**self.time_entry_data)
-        with self.assertRaises(ValidationError) as cm:
+        with self.assertRaisesMessage(
+            ValidationError, "Endzeit muss nach der Startzeit liegen"
+        ):
             entry.clean()
 
-        self.assertIn("end_time", cm.exception.message_dict)
-        self.assertIn(
-            "Endzeit muss nach der Startzeit liegen",
-            cm.exception.message_dict["end_time"][0],
-        )
-
     def test_validation_negative_lunch_break(self):
         """Test that lunch break cannot be negative."""
         self.time_entry_data["lunch_break_minutes"] = -30
 
         entry = TimeEntry(**self.time_entry_data)
-        with self.assertRaises(ValidationError) as cm:
+        with self.assertRaisesMessage(
+            ValidationError, "Mittagspause kann nicht negativ sein"
+        ):
             entry.clean()
 
-        self.assertIn("lunch_break_minutes", cm.exception.message_dict)
-
     def test_validation_future_date(self):
         """Test that date cannot be in the future."""
-        from django.utils import timezone
-
-        future_date = timezone.now().date()
-        future_date = future_date.replace(year=future_date.year + 1)
-
-        self.time_entry_data["date"] = future_date
+        self.time_entry_data["date"] = date(9999, 12, 31)
 
         entry = TimeEntry(**self.time_entry_data)
-        with self.assertRaises(ValidationError) as cm:
+        with self.assertRaisesMessage(
+            ValidationError, "Datum kann nicht in der Zukunft liegen"
+        ):
             entry.clean()
 
-        self.assertIn("date", cm.exception.message_dict)
-        self.assertIn(
-            "Datum kann nicht in der Zukunft liegen",
-            cm.exception.message_dict["date"][0],
-        )
-
     def test_total_work_minutes_calculation(self):
         """Test calculation of total work minutes."""
-        entry = TimeEntry.objects.create(**self.time_entry_data)
+        entry = TimeEntry(**self.time_entry_data)
 
         # 9:00 to 17:00 = 480 minutes, minus 30 minutes lunch = 450 minutes
         expected_minutes = 450
@@ -232,12 +342,22 @@ class TimeEntryModelTest(TestCase):
 
     def test_total_work_hours_calculation(self):
         """Test calculation of total work hours."""
-        entry = TimeEntry.objects.create(**self.time_entry_data)
+        entry = TimeEntry(**self.time_entry_data)
 
         # 450 minutes = 7.5 hours
         expected_hours = 7.5
         self.assertEqual(entry.total_work_hours, expected_hours)
 
+    def test_work_time_follows_changed_times(self):
+        """Test work time totals reflect times changed after a read."""
+        entry = TimeEntry(**self.time_entry_data)
+        self.assertEqual(entry.total_work_hours, 7.5)
+
+        entry.end_time = time(18, 0)
+        entry.lunch_break_minutes = 60
+        self.assertEqual(entry.total_work_minutes, 480)
+        self.assertEqual(entry.total_work_hours, 8)
+
     def test_overnight_work_calculation(self):
         """Test work time calculation for overnight shifts."""
         self.time_entry_data.update(
@@ -247,30 +367,15 @@ class TimeEntryModelTest(TestCase):
                 "lunch_break_minutes": 60,
             }
         )
-        entry = TimeEntry.objects.create(**self.time_entry_data)
+        entry = TimeEntry(**self.time_entry_data)
 
         # 22:00 to 06:00 next day = 8 hours = 480 minutes, minus 60 minutes lunch = 420 minutes  # noqa: E501
         expected_minutes = 420
         self.assertEqual(entry.total_work_minutes, expected_minutes)
 
-    def test_pollution_level_choices(self):
-        """Test pollution level choices."""
-        # Test all valid pollution levels
-        for level, description in TimeEntry.POLLUTION_CHOICES:
-            self.time_entry_data.update(
-                {
-                    "pollution_level": level,
-                    "date": date(
-                        2024, 1, 15 + level
-                    ),  # Different dates to avoid unique constraint
-                }
-            )
-            entry = TimeEntry.objects.create(**self.time_entry_data)
-            self.assertEqual(entry.pollution_level, level)
-            self.assertEqual(entry.get_pollution_level_display(), description)
-
     def test_save_calls_clean(self):
         """Test that save() calls clean() for validation."""
+        # clean() raises before any query is issued, so this stays DB-free
         self.time_entry_data.update(
             {
                 "start_time": time(10, 0),  # 10 AM
@@ -286,29 +391,34 @@ class TimeEntryModelTest(TestCase):
 class FirstLoginViewTest(TestCase):
     """Test the first login functionality."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        # Set up first login token (hashed once per class)
+        cls.token = "test-token-123"
+        cls.token_hash = hashlib.sha256(cls.token.encode()).hexdigest()
+        cls.first_login_url = reverse(
+            "accounts:first_login", kwargs={"token": cls.token}
+        )
+        cls.user = User.objects.create_user(
             username="newuser",
             email="new@example.com",
             first_name="New",
             last_name="User",
             role="employee",
+            first_login_token=cls.token_hash,
+            is_invited=True,
         )
-        # Set up first login token
-        self.token = "test-token-123"
-        self.user.first_login_token = hashlib.sha256(self.token.encode()).hexdigest()
-        self.user.is_invited = True
-        self.user.save()
 
     def test_first_login_get(self):
         """Test GET request shows the password setup form."""
-        url = reverse("accounts:first_login", kwargs={"token": self.token})
+        url = self.first_login_url
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "New User")
         self.assertContains(response, "Neues Passwort")
+        self.assertContains(response, 'minlength="8"')
+        self.assertIn("no-store", response["Cache-Control"])
 
     def test_first_login_invalid_token(self):
         """Test first login with invalid token."""
@@ -318,9 +428,27 @@ class FirstLoginViewTest(TestCase):
         # Should redirect to admin login
         self.assertEqual(response.status_code, 302)
 
+    def test_first_login_oversized_token(self):
+        """Test first login rejects oversized tokens without a lookup."""
+        url = reverse("accounts:first_login", kwargs={"token": "x" * 129})
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_first_login_malformed_token(self):
+        """Test first login rejects non-URL-safe tokens without a lookup."""
+        for token in ("x" * 42 + "!", "token with spaces", "tökén"):
+            with self.subTest(token=token):
+                url = reverse("accounts:first_login", kwargs={"token": token})
+                with self.assertNumQueries(0):
+                    response = self.client.get(url)
+
+                self.assertEqual(response.status_code, 302)
+
     def test_first_login_post_success(self):
         """Test successful password setup."""
-        url = reverse("accounts:first_login", kwargs={"token": self.token})
+        url = self.first_login_url
         data = {"password1": "testpassword123", "password2": "testpassword123"}
         response = self.client.post(url, data)
 
@@ -332,9 +460,32 @@ class FirstLoginViewTest(TestCase):
         self.assertIsNone(self.user.first_login_token)
         self.assertTrue(self.user.check_password("testpassword123"))
 
+    def test_first_login_double_submit(self):
+        """Test a token used up before the locked re-read sets no password."""
+        select_for_update = QuerySet.select_for_update
+
+        def use_token_first(queryset, *args, **kwargs):
+            # Simulate a concurrent submit completing after the first lookup
+            User.objects.filter(pk=self.user.pk).update(first_login_token=None)
+            return select_for_update(queryset, *args, **kwargs)
+
+        url = self.first_login_url
+        data = {"password1": "testpassword123", "password2": "testpassword123"}
+        with mock.patch.object(
+            QuerySet, "select_for_update", autospec=True, side_effect=use_token_first
+        ):
+            response = self.client.post(url, data)
+
+        self.assertRedirects(
+            response, reverse("admin:login"), fetch_redirect_response=False
+        )
+        self.assertNotIn("_auth_user_id", self.client.session)
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.has_usable_password())
+
     def test_first_login_password_mismatch(self):
         """Test password setup with mismatched passwords."""
-        url = reverse("accounts:first_login", kwargs={"token": self.token})
+        url = self.first_login_url
         data = {"password1": "testpassword123", "password2": "differentpassword123"}
         response = self.client.post(url, data)
 
@@ -343,66 +494,83 @@ class FirstLoginViewTest(TestCase):
 
     def test_first_login_short_password(self):
         """Test password setup with too short password."""
-        url = reverse("accounts:first_login", kwargs={"token": self.token})
+        url = self.first_login_url
         data = {"password1": "123", "password2": "123"}
         response = self.client.post(url, data)
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "mindestens 8 Zeichen")
 
+    def test_first_login_empty_password(self):
+        """Test password setup with an empty password."""
+        url = self.first_login_url
+        data = {"password1": "", "password2": ""}
+        response = self.client.post(url, data)
 
-class AdminInterfaceTest(TestCase):
-    """Test the admin interface for user and time entry management."""
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Bitte geben Sie ein Passwort ein")
+        self.assertNotContains(response, "mindestens 8 Zeichen")
 
-    def setUp(self):
-        self.admin_user = User.objects.create_superuser(
+
+class AdminTestBase(TestCase):
+    """Base class providing a superuser created once per test class."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser(
             username="admin",
             email="admin@example.com",
             password="admin123",
             role="backoffice",
         )
-        self.employee_user = User.objects.create_user(
+
+
+@slow
+class AdminInterfaceTest(ContentAssertionsMixin, AdminTestBase):
+    """Test the admin interface for user and time entry management."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.employee_user = User.objects.create_user(
             username="employee",
             email="employee@example.com",
             first_name="Test",
             last_name="Employee",
             role="employee",
         )
+
+    def setUp(self):
         self.client.login(username="admin", password="admin123")
 
-    def test_admin_user_list(self):
-        """Test that users are displayed in admin with proper fields and filters."""
-        url = reverse("admin:accounts_user_changelist")
-        response = self.client.get(url)
+    def test_admin_user_changelist_renders_correctly(self):
+        """Test user changelist shows list_display fields and filters."""
+        response = self.client.get(ADMIN_USER_CHANGELIST_URL)
 
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, "admin")
-        self.assertContains(response, "employee")
-        # Check list_display fields are shown
-        self.assertContains(response, "admin@example.com")
-        self.assertContains(response, "backoffice")
-
-    def test_admin_user_filters_available(self):
-        """Test that user list has proper filters."""
-        url = reverse("admin:accounts_user_changelist")
-        response = self.client.get(url)
-
-        # Check for filter options based on list_filter configuration
-        self.assertContains(response, "role")
-        self.assertContains(response, "is_invited")
-        self.assertContains(response, "is_active")
+        self.assertAllContain(
+            response,
+            "admin",
+            "employee",
+            # list_display fields
+            "admin@example.com",
+            "backoffice",
+            # list_filter options
+            "role",
+            "is_invited",
+            "is_active",
+        )
 
     def test_admin_create_user_form(self):
         """Test the add user form in admin."""
-        url = reverse("admin:accounts_user_add")
+        url = ADMIN_USER_ADD_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Rolle")
 
-    def test_admin_timeentry_list(self):
-        """Test that time entries are displayed in admin."""
-        # Create a time entry first
+    def test_admin_timeentry_changelist_renders_correctly(self):
+        """Test time entry changelist shows entries, filters and actions."""
         TimeEntry.objects.create(
             user=self.employee_user,
             date=date(2025, 1, 15),
@@ -415,26 +583,23 @@ class AdminInterfaceTest(TestCase):
             updated_by=self.admin_user,
         )
 
-        url = reverse("admin:accounts_timeentry_changelist")
-        response = self.client.get(url)
+        # One render covers list display, filters, date hierarchy and actions
+        response = self.client.get(ADMIN_TIMEENTRY_CHANGELIST_URL)
 
         self.assertEqual(response.status_code, 200)
-        # Check that we can find the time entry in the response
-        self.assertContains(response, "2025-01-15")
-        self.assertContains(response, "Test Employee")
-        self.assertContains(
-            response, "09:00"
-        )  # Changed from "09:00:00" as format might be different
-        self.assertContains(response, "17:00")  # Changed from "17:00:00"
-
-    def test_admin_timeentry_filters_available(self):
-        """Test that time entry list has comprehensive filters."""
-        url = reverse("admin:accounts_timeentry_changelist")
-        response = self.client.get(url)
-
-        # Check for filter options based on list_filter configuration
-        self.assertContains(response, "pollution_level")
-        self.assertContains(response, "date")
+        self.assertAllContain(
+            response,
+            # The time entry itself
+            "2025-01-15",
+            "Test Employee",
+            "09:00",
+            "17:00",
+            # list_filter options
+            "pollution_level",
+            "date",
+            # CSV export action
+            "export_to_csv",
+        )
 
     def test_admin_timeentry_search_functionality(self):
         """Test search functionality for time entries."""
@@ -451,42 +616,12 @@ class AdminInterfaceTest(TestCase):
             updated_by=self.admin_user,
         )
 
-        url = reverse("admin:accounts_timeentry_changelist")
+        url = ADMIN_TIMEENTRY_CHANGELIST_URL
         response = self.client.get(url + "?q=Test")
 
         self.assertEqual(response.status_code, 200)
         # Should find entries based on user name search
 
-    def test_admin_timeentry_date_hierarchy(self):
-        """Test date hierarchy navigation in time entries."""
-        url = reverse("admin:accounts_timeentry_changelist")
-        response = self.client.get(url)
-
-        # Should have date hierarchy for easy navigation
-        self.assertEqual(response.status_code, 200)
-
-    def test_admin_timeentry_csv_export_action(self):
-        """Test CSV export action for time entries."""
-        # Create a time entry
-        TimeEntry.objects.create(
-            user=self.employee_user,
-            date=date(2024, 1, 15),
-            start_time=time(9, 0),
-            end_time=time(17, 0),
-            lunch_break_minutes=30,
-            pollution_level=2,
-            notes="Export test",
-            created_by=self.admin_user,
-            updated_by=self.admin_user,
-        )
-
-        url = reverse("admin:accounts_timeentry_changelist")
-
-        # Test that export action is available
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, "export_to_csv")
-
     def test_admin_models_registered(self):
         """Test that all required models are registered in admin."""
         from django.contrib import admin
@@ -508,26 +643,22 @@ class AdminInterfaceTest(TestCase):
         self.assertTrue(hasattr(timeentry_admin, "list_filter"))
 
 
-class EmailInvitationTest(TestCase):
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class EmailInvitationTest(SimpleTestCase):
     """Test email invitation functionality."""
 
     def setUp(self):
-        self.admin_user = User.objects.create_superuser(
-            username="admin",
-            email="admin@example.com",
-            password="admin123",
-            role="backoffice",
-        )
         # Clear any existing emails
-        mail.outbox = []
+        mail.outbox.clear()
 
     def test_user_creation_sends_email(self):
         """Test that creating a user through admin sends invitation email."""
         # This would typically be tested through the admin interface
         # For now, we'll test the basic email functionality
 
-        # Create a user (simulating admin creation)
-        user = User.objects.create_user(
+        # Build a user in memory (simulating admin creation); nothing here
+        # needs the row to be saved
+        user = User(
             username="newuser",
             email="newuser@example.com",
             first_name="New",
@@ -536,7 +667,7 @@ class EmailInvitationTest(TestCase):
         )
 
         # In actual admin save, email would be sent
-        # Here we verify the user was created properly
+        # Here we verify the user was set up properly
         self.assertEqual(user.role, "employee")
         self.assertEqual(user.email, "newuser@example.com")
 
@@ -544,30 +675,33 @@ class EmailInvitationTest(TestCase):
 class CreateEmployeeViewTest(TestCase):
     """Test the create employee functionality."""
 
-    def setUp(self):
-        self.client = Client()
-        # Create a backoffice user for testing
-        self.backoffice_user = User.objects.create_user(
-            username="backoffice",
-            email="backoffice@example.com",
-            password="testpass123",
-            first_name="Back",
-            last_name="Office",
-            role="backoffice",
-        )
-        # Create a regular employee user
-        self.employee_user = User.objects.create_user(
-            username="employee",
-            email="employee@example.com",
-            password="testpass123",
-            first_name="Employee",
-            last_name="User",
-            role="employee",
+    @classmethod
+    def setUpTestData(cls):
+        # Insert both users in one query; tests log in with force_login()
+        cls.backoffice_user, cls.employee_user = User.objects.bulk_create(
+            [
+                # Backoffice user for testing
+                User(
+                    username="backoffice",
+                    email="backoffice@example.com",
+                    first_name="Back",
+                    last_name="Office",
+                    role="backoffice",
+                ),
+                # Regular employee user
+                User(
+                    username="employee",
+                    email="employee@example.com",
+                    first_name="Employee",
+                    last_name="User",
+                    role="employee",
+                ),
+            ]
         )
 
     def test_create_employee_requires_login(self):
         """Test that create employee view requires login."""
-        url = reverse("accounts:create_employee")
+        url = CREATE_EMPLOYEE_URL
         response = self.client.get(url)
 
         # Should redirect to login
@@ -575,8 +709,8 @@ class CreateEmployeeViewTest(TestCase):
 
     def test_create_employee_requires_backoffice_role(self):
         """Test that create employee view requires backoffice role."""
-        self.client.login(username="employee", password="testpass123")
-        url = reverse("accounts:create_employee")
+        self.client.force_login(self.employee_user)
+        url = CREATE_EMPLOYEE_URL
         response = self.client.get(url)
 
         # Should be forbidden or redirect (depends on user_passes_test behavior)
@@ -584,8 +718,8 @@ class CreateEmployeeViewTest(TestCase):
 
     def test_create_employee_get_success(self):
         """Test GET request to create employee view."""
-        self.client.login(username="backoffice", password="testpass123")
-        url = reverse("accounts:create_employee")
+        self.client.force_login(self.backoffice_user)
+        url = CREATE_EMPLOYEE_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
@@ -597,8 +731,8 @@ class CreateEmployeeViewTest(TestCase):
 
     def test_create_employee_post_success(self):
         """Test successful employee creation."""
-        self.client.login(username="backoffice", password="testpass123")
-        url = reverse("accounts:create_employee")
+        self.client.force_login(self.backoffice_user)
+        url = CREATE_EMPLOYEE_URL
 
         data = {
             "first_name": "John",
@@ -624,8 +758,8 @@ class CreateEmployeeViewTest(TestCase):
 
     def test_create_employee_duplicate_email(self):
         """Test creating employee with duplicate email."""
-        self.client.login(username="backoffice", password="testpass123")
-        url = reverse("accounts:create_employee")
+        self.client.force_login(self.backoffice_user)
+        url = CREATE_EMPLOYEE_URL
 
         data = {
             "first_name": "Test",
@@ -642,8 +776,8 @@ class CreateEmployeeViewTest(TestCase):
 
     def test_create_employee_missing_required_fields(self):
         """Test creating employee with missing required fields."""
-        self.client.login(username="backoffice", password="testpass123")
-        url = reverse("accounts:create_employee")
+        self.client.force_login(self.backoffice_user)
+        url = CREATE_EMPLOYEE_URL
 
         # Missing first_name
         data = {
@@ -660,8 +794,8 @@ class CreateEmployeeViewTest(TestCase):
 
     def test_create_employee_backoffice_role(self):
         """Test creating employee with backoffice role."""
-        self.client.login(username="backoffice", password="testpass123")
-        url = reverse("accounts:create_employee")
+        self.client.force_login(self.backoffice_user)
+        url = CREATE_EMPLOYEE_URL
 
         data = {
             "first_name": "Jane",
@@ -686,8 +820,6 @@ class RoleBasedPermissionTest(TestCase):
     """Test role-based permission system as per US-B01."""
 
     def setUp(self):
-        self.client = Client()
-
         # Create employee user
         self.employee = User.objects.create_user(
             username="employee",
@@ -718,8 +850,8 @@ class RoleBasedPermissionTest(TestCase):
             role="backoffice",
         )
 
-        # Create time entries
-        self.employee_entry = TimeEntry.objects.create(
+        # Create time entries (known-valid fixtures, so skip clean())
+        self.employee_entry = TimeEntry(
             user=self.employee,
             date=date(2024, 1, 15),
             start_time=time(9, 0),
@@ -729,8 +861,9 @@ class RoleBasedPermissionTest(TestCase):
             created_by=self.backoffice,
             updated_by=self.backoffice,
         )
+        self.employee_entry.save(skip_validation=True)
 
-        self.other_employee_entry = TimeEntry.objects.create(
+        self.other_employee_entry = TimeEntry(
             user=self.other_employee,
             date=date(2024, 1, 15),
             start_time=time(8, 0),
@@ -740,6 +873,7 @@ class RoleBasedPermissionTest(TestCase):
             created_by=self.backoffice,
             updated_by=self.backoffice,
         )
+        self.other_employee_entry.save(skip_validation=True)
 
     def test_permission_functions(self):
         """Test permission checking functions."""
@@ -1369,8 +1503,6 @@ class TimeEntryViewTest(TestCase):
     """Test time entry views (US-C01, US-C02, US-C03)."""
 
     def setUp(self):
-        self.client = Client()
-
         self.employee = User.objects.create_user(
             username="employee",
             email="employee@example.com",
@@ -1398,8 +1530,8 @@ class TimeEntryViewTest(TestCase):
             role="backoffice",
         )
 
-        # Create test time entries
-        self.employee_entry = TimeEntry.objects.create(
+        # Create test time entries (known-valid fixture, so skip clean())
+        self.employee_entry = TimeEntry(
             user=self.employee,
             date=date(2024, 1, 15),
             start_time=time(9, 0),
@@ -1410,10 +1542,11 @@ class TimeEntryViewTest(TestCase):
             created_by=self.backoffice,
             updated_by=self.backoffice,
         )
+        self.employee_entry.save(skip_validation=True)
 
     def test_time_entry_list_requires_login(self):
         """Test that time entry list requires login."""
-        url = reverse("accounts:time_entry_list")
+        url = TIME_ENTRY_LIST_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 302)
@@ -1422,7 +1555,7 @@ class TimeEntryViewTest(TestCase):
     def test_time_entry_list_shows_user_entries(self):
         """Test that list view only shows user's own entries."""
         self.client.login(username="employee", password="testpass123")
-        url = reverse("accounts:time_entry_list")
+        url = TIME_ENTRY_LIST_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
@@ -1433,10 +1566,74 @@ class TimeEntryViewTest(TestCase):
         )  # Work hours with German decimal separator
         self.assertContains(response, "Niedrig")  # Pollution level
 
+    def test_time_entry_list_query_count_independent_of_entries(self):
+        """Test that list view queries don't grow with the number of entries."""
+        self.client.force_login(self.employee)
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get(TIME_ENTRY_LIST_URL)
+
+        # More entries, with vehicle usage, must not add per-row queries (N+1)
+        vehicle = Vehicle.objects.create(
+            license_plate="LIST-1", make="Test", model="Car", year=2020
+        )
+        for day in (16, 17):
+            entry = TimeEntry(
+                user=self.employee,
+                date=date(2024, 1, day),
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                lunch_break_minutes=30,
+                pollution_level=1,
+                created_by=self.backoffice,
+                updated_by=self.backoffice,
+            )
+            entry.save(skip_validation=True)
+            VehicleUsage.objects.create(
+                time_entry=entry,
+                vehicle=vehicle,
+                start_kilometers=1000,
+                end_kilometers=1100,
+            )
+
+        with self.assertNumQueries(len(baseline)):
+            response = self.client.get(TIME_ENTRY_LIST_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "LIST-1")
+        self.assertContains(response, "100km")
+
+    def test_time_entry_list_paginates(self):
+        """Test that list view pages entries and keeps filters in page links."""
+        TimeEntry.objects.bulk_create(
+            TimeEntry(
+                user=self.employee,
+                date=date(2023, 1, 1) + timedelta(days=offset),
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                lunch_break_minutes=30,
+                pollution_level=1,
+                created_by=self.backoffice,
+                updated_by=self.backoffice,
+            )
+            for offset in range(50)
+        )
+        self.client.force_login(self.employee)
+
+        response = self.client.get(TIME_ENTRY_LIST_URL, {"date_from": "2023-01-01"})
+        page_obj = response.context["page_obj"]
+        self.assertEqual(page_obj.paginator.count, 51)
+        self.assertEqual(len(page_obj), 50)
+        self.assertContains(response, "?date_from=2023-01-01&amp;page=2")
+
+        response = self.client.get(
+            TIME_ENTRY_LIST_URL, {"date_from": "2023-01-01", "page": 2}
+        )
+        self.assertEqual(len(response.context["page_obj"]), 1)
+        self.assertContains(response, "01.01.2023")
+
     def test_time_entry_create_get(self):
         """Test GET request to time entry create view."""
         self.client.login(username="employee", password="testpass123")
-        url = reverse("accounts:time_entry_create")
+        url = TIME_ENTRY_CREATE_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
@@ -1451,7 +1648,7 @@ class TimeEntryViewTest(TestCase):
     def test_time_entry_create_post_success(self):
         """Test successful time entry creation."""
         self.client.login(username="employee", password="testpass123")
-        url = reverse("accounts:time_entry_create")
+        url = TIME_ENTRY_CREATE_URL
 
         data = {
             "date": "2024-02-15",
@@ -1466,7 +1663,7 @@ class TimeEntryViewTest(TestCase):
 
         # Should redirect to list view
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse("accounts:time_entry_list"))
+        self.assertRedirects(response, TIME_ENTRY_LIST_URL)
 
         # Check entry was created
         created_entry = TimeEntry.objects.get(
@@ -1480,7 +1677,7 @@ class TimeEntryViewTest(TestCase):
     def test_time_entry_create_post_validation_error(self):
         """Test time entry creation with validation errors."""
         self.client.login(username="employee", password="testpass123")
-        url = reverse("accounts:time_entry_create")
+        url = TIME_ENTRY_CREATE_URL
 
         # Invalid data: end before start
         data = {
@@ -1528,7 +1725,7 @@ class TimeEntryViewTest(TestCase):
 
         # Should redirect to list view
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse("accounts:time_entry_list"))
+        self.assertRedirects(response, TIME_ENTRY_LIST_URL)
 
         # Check entry was updated
         self.employee_entry.refresh_from_db()
@@ -1559,7 +1756,7 @@ class TimeEntryViewTest(TestCase):
 
         # Should redirect with error message
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse("accounts:time_entry_list"))
+        self.assertRedirects(response, TIME_ENTRY_LIST_URL)
 
     def test_time_entry_delete_success(self):
         """Test successful time entry deletion."""
@@ -1570,12 +1767,25 @@ class TimeEntryViewTest(TestCase):
 
         # Should redirect to list view
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse("accounts:time_entry_list"))
+        self.assertRedirects(response, TIME_ENTRY_LIST_URL)
 
         # Check entry was deleted
         with self.assertRaises(TimeEntry.DoesNotExist):
             TimeEntry.objects.get(id=self.employee_entry.id)
 
+    def test_time_entry_delete_query_count(self):
+        """Test that deleting an entry doesn't re-select the row it loaded."""
+        self.client.force_login(self.employee)
+        url = reverse("accounts:time_entry_delete", args=[self.employee_entry.id])
+
+        # Session, user, entry (id and date only), cascaded vehicle usage
+        # delete, entry delete
+        with self.assertNumQueries(5):
+            response = self.client.post(url)
+
+        self.assertRedirects(response, TIME_ENTRY_LIST_URL)
+        self.assertFalse(TimeEntry.objects.filter(id=self.employee_entry.id).exists())
+
     def test_time_entry_delete_other_user_entry_forbidden(self):
         """Test that user cannot delete other user's entries."""
         other_entry = TimeEntry.objects.create(
@@ -1596,7 +1806,7 @@ class TimeEntryViewTest(TestCase):
 
         # Should redirect with error message
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse("accounts:time_entry_list"))
+        self.assertRedirects(response, TIME_ENTRY_LIST_URL)
 
         # Entry should still exist
         self.assertTrue(TimeEntry.objects.filter(id=other_entry.id).exists())
@@ -1607,12 +1817,13 @@ class TimeEntryViewTest(TestCase):
         self.employee_entry.delete()
 
         self.client.login(username="employee", password="testpass123")
-        url = reverse("accounts:time_entry_list")
+        url = TIME_ENTRY_LIST_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Noch keine Zeiteinträge vorhanden")
         self.assertContains(response, "Ersten Zeiteintrag erstellen")
+        self.assertIsNone(response.context["vehicle_stats"])
 
     def test_time_entry_views_calculate_work_hours_correctly(self):
         """Test that views display correct work hour calculations."""
@@ -1629,7 +1840,7 @@ class TimeEntryViewTest(TestCase):
         )
 
         self.client.login(username="employee", password="testpass123")
-        url = reverse("accounts:time_entry_list")
+        url = TIME_ENTRY_LIST_URL
         response = self.client.get(url)
 
         # Should show 8.25 hours (9.5 - 1.25) with German decimal separator
@@ -1638,7 +1849,7 @@ class TimeEntryViewTest(TestCase):
     def test_time_entry_calendar_view_authenticated(self):
         """Test calendar view for authenticated employee."""
         self.client.login(username="employee", password="testpass123")
-        url = reverse("accounts:time_entry_calendar")
+        url = TIME_ENTRY_CALENDAR_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
@@ -1649,7 +1860,7 @@ class TimeEntryViewTest(TestCase):
     def test_time_entry_calendar_with_params(self):
         """Test calendar view with month/year parameters."""
         self.client.login(username="employee", password="testpass123")
-        url = reverse("accounts:time_entry_calendar")
+        url = TIME_ENTRY_CALENDAR_URL
         response = self.client.get(url, {"year": 2024, "month": 1})
 
         self.assertEqual(response.status_code, 200)
@@ -1658,7 +1869,7 @@ class TimeEntryViewTest(TestCase):
     def test_time_entry_calendar_invalid_params(self):
         """Test calendar view with invalid parameters defaults to current month."""
         self.client.login(username="employee", password="testpass123")
-        url = reverse("accounts:time_entry_calendar")
+        url = TIME_ENTRY_CALENDAR_URL
         response = self.client.get(url, {"year": "invalid", "month": "invalid"})
 
         self.assertEqual(response.status_code, 200)
@@ -1681,8 +1892,6 @@ class ViewRoleBasedAccessTest(TestCase):
     """Test view-level role-based access control."""
 
     def setUp(self):
-        self.client = Client()
-
         self.employee = User.objects.create_user(
             username="employee",
             email="employee@example.com",
@@ -1699,7 +1908,7 @@ class ViewRoleBasedAccessTest(TestCase):
 
     def test_create_employee_view_access(self):
         """Test that only backoffice can access create employee view."""
-        url = reverse("accounts:create_employee")
+        url = CREATE_EMPLOYEE_URL
 
         # Anonymous user should be redirected to login
         response = self.client.get(url)
@@ -1718,7 +1927,7 @@ class ViewRoleBasedAccessTest(TestCase):
 
     def test_home_view_role_based_content(self):
         """Test that home view shows different content based on role."""
-        url = reverse("home")
+        url = HOME_URL
 
         # Employee view
         self.client.login(username="employee", password="testpass123")
@@ -1740,24 +1949,41 @@ class ViewRoleBasedAccessTest(TestCase):
         self.assertContains(response, "Mitarbeiter anlegen")  # Has create employee link
 
 
-class AuthenticationFlowsTest(TestCase):
+# The reset token is made once in setUpTestData; pin its lifetime so it can't
+# expire mid-run if the project timeout is ever shortened
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    PASSWORD_RESET_TIMEOUT=60 * 60 * 24,
+)
+class AuthenticationFlowsTest(ContentAssertionsMixin, TestCase):
     """Test authentication flows including login, logout, and password reset."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "first_name": "Test",
-            "last_name": "User",
-            "password": "testpass123",
-            "role": "employee",
-        }
-        self.user = User.objects.create_user(**self.user_data)
+    @classmethod
+    def setUpTestData(cls):
+        (cls.user,) = User.objects.bulk_create(
+            [
+                User(
+                    username="testuser",
+                    email="test@example.com",
+                    first_name="Test",
+                    last_name="User",
+                    password=make_password("testpass123"),
+                    role="employee",
+                )
+            ]
+        )
+        # The user's password and last_login are fixed for the class, so one
+        # reset token stays valid for every test (each test rolls back)
+        cls.uid = urlsafe_base64_encode(force_bytes(cls.user.pk))
+        cls.reset_token = default_token_generator.make_token(cls.user)
+        cls.reset_confirm_url = reverse(
+            "accounts:password_reset_confirm",
+            kwargs={"uidb64": cls.uid, "token": cls.reset_token},
+        )
 
     def test_login_view_get(self):
         """Test GET request to login view shows login form."""
-        url = reverse("accounts:login")
+        url = LOGIN_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
@@ -1768,17 +1994,17 @@ class AuthenticationFlowsTest(TestCase):
 
     def test_login_success(self):
         """Test successful login redirects to home page."""
-        url = reverse("accounts:login")
+        url = LOGIN_URL
         data = {"username": "testuser", "password": "testpass123"}
-        response = self.client.post(url, data, follow=True)
+        response = self.client.post(url, data)
 
-        self.assertEqual(response.status_code, 200)
-        self.assertTrue(response.wsgi_request.user.is_authenticated)
-        self.assertEqual(response.wsgi_request.user, self.user)
+        # Check the redirect and session without rendering the home page
+        self.assertRedirects(response, HOME_URL, fetch_redirect_response=False)
+        self.assertEqual(int(self.client.session["_auth_user_id"]), self.user.pk)
 
     def test_login_invalid_credentials(self):
         """Test login with invalid credentials shows error."""
-        url = reverse("accounts:login")
+        url = LOGIN_URL
         data = {"username": "testuser", "password": "wrongpassword"}
         response = self.client.post(url, data)
 
@@ -1788,7 +2014,7 @@ class AuthenticationFlowsTest(TestCase):
 
     def test_login_nonexistent_user(self):
         """Test login with nonexistent user shows error."""
-        url = reverse("accounts:login")
+        url = LOGIN_URL
         data = {"username": "nonexistent", "password": "testpass123"}
         response = self.client.post(url, data)
 
@@ -1801,15 +2027,15 @@ class AuthenticationFlowsTest(TestCase):
         self.client.login(username="testuser", password="testpass123")
 
         # Then logout
-        url = reverse("accounts:logout")
+        url = LOGOUT_URL
         response = self.client.post(url)
 
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse("accounts:login"))
+        self.assertRedirects(response, LOGIN_URL)
 
     def test_password_reset_view_get(self):
         """Test GET request to password reset view."""
-        url = reverse("accounts:password_reset")
+        url = PASSWORD_RESET_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
@@ -1818,12 +2044,12 @@ class AuthenticationFlowsTest(TestCase):
 
     def test_password_reset_post_valid_email(self):
         """Test password reset with valid email sends email."""
-        url = reverse("accounts:password_reset")
+        url = PASSWORD_RESET_URL
         data = {"email": self.user.email}
         response = self.client.post(url, data)
 
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse("accounts:password_reset_done"))
+        self.assertRedirects(response, PASSWORD_RESET_DONE_URL)
 
         # Check email was sent
         self.assertEqual(len(mail.outbox), 1)
@@ -1834,20 +2060,20 @@ class AuthenticationFlowsTest(TestCase):
 
     def test_password_reset_post_invalid_email(self):
         """Test password reset with invalid email still redirects (security)."""
-        url = reverse("accounts:password_reset")
+        url = PASSWORD_RESET_URL
         data = {"email": "nonexistent@example.com"}
         response = self.client.post(url, data)
 
         # Django redirects even for invalid emails (security best practice)
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse("accounts:password_reset_done"))
+        self.assertRedirects(response, PASSWORD_RESET_DONE_URL)
 
         # No email should be sent
         self.assertEqual(len(mail.outbox), 0)
 
     def test_password_reset_done_view(self):
         """Test password reset done view."""
-        url = reverse("accounts:password_reset_done")
+        url = PASSWORD_RESET_DONE_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
@@ -1856,17 +2082,7 @@ class AuthenticationFlowsTest(TestCase):
 
     def test_password_reset_confirm_valid_token(self):
         """Test password reset confirm with valid token."""
-        from django.contrib.auth.tokens import default_token_generator
-        from django.utils.encoding import force_bytes
-        from django.utils.http import urlsafe_base64_encode
-
-        # Generate valid token and uid
-        token = default_token_generator.make_token(self.user)
-        uid = urlsafe_base64_encode(force_bytes(self.user.pk))
-
-        url = reverse(
-            "accounts:password_reset_confirm", kwargs={"uidb64": uid, "token": token}
-        )
+        url = self.reset_confirm_url
         response = self.client.get(url)
 
         # Django redirects to set-password URL on first access with valid token
@@ -1876,18 +2092,15 @@ class AuthenticationFlowsTest(TestCase):
         # Follow the redirect to the actual form
         response = self.client.get(response.url)
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, "Neues Passwort festlegen")
-        self.assertContains(response, "Passwort-Anforderungen")
+        self.assertAllContain(
+            response, "Neues Passwort festlegen", "Passwort-Anforderungen"
+        )
 
     def test_password_reset_confirm_invalid_token(self):
         """Test password reset confirm with invalid token."""
-        from django.utils.encoding import force_bytes
-        from django.utils.http import urlsafe_base64_encode
-
-        uid = urlsafe_base64_encode(force_bytes(self.user.pk))
         url = reverse(
             "accounts:password_reset_confirm",
-            kwargs={"uidb64": uid, "token": "invalid-token"},
+            kwargs={"uidb64": self.uid, "token": "invalid-token"},
         )
         response = self.client.get(url)
 
@@ -1896,17 +2109,7 @@ class AuthenticationFlowsTest(TestCase):
 
     def test_password_reset_confirm_post_success(self):
         """Test successful password reset confirmation."""
-        from django.contrib.auth.tokens import default_token_generator
-        from django.utils.encoding import force_bytes
-        from django.utils.http import urlsafe_base64_encode
-
-        # Generate valid token and uid
-        token = default_token_generator.make_token(self.user)
-        uid = urlsafe_base64_encode(force_bytes(self.user.pk))
-
-        url = reverse(
-            "accounts:password_reset_confirm", kwargs={"uidb64": uid, "token": token}
-        )
+        url = self.reset_confirm_url
 
         # First access the URL to get the set-password redirect
         response = self.client.get(url)
@@ -1917,24 +2120,15 @@ class AuthenticationFlowsTest(TestCase):
         response = self.client.post(response.url, data)
 
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse("accounts:password_reset_complete"))
+        self.assertRedirects(response, PASSWORD_RESET_COMPLETE_URL)
 
-        # Check password was changed
-        self.user.refresh_from_db()
-        self.assertTrue(self.user.check_password("newpassword123"))
+        # Check password was changed, fetching only the stored hash
+        password = User.objects.values_list("password", flat=True).get(pk=self.user.pk)
+        self.assertTrue(check_password("newpassword123", password))
 
     def test_password_reset_confirm_post_password_mismatch(self):
         """Test password reset confirmation with password mismatch."""
-        from django.contrib.auth.tokens import default_token_generator
-        from django.utils.encoding import force_bytes
-        from django.utils.http import urlsafe_base64_encode
-
-        token = default_token_generator.make_token(self.user)
-        uid = urlsafe_base64_encode(force_bytes(self.user.pk))
-
-        url = reverse(
-            "accounts:password_reset_confirm", kwargs={"uidb64": uid, "token": token}
-        )
+        url = self.reset_confirm_url
 
         # First access the URL to get the set-password redirect
         response = self.client.get(url)
@@ -1947,120 +2141,154 @@ class AuthenticationFlowsTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Die beiden Passwörter sind nicht identisch")
 
+
+class PasswordResetCompleteViewTest(ContentAssertionsMixin, SimpleTestCase):
+    """Test the password reset complete page, which needs no database."""
+
     def test_password_reset_complete_view(self):
         """Test password reset complete view."""
-        url = reverse("accounts:password_reset_complete")
+        url = PASSWORD_RESET_COMPLETE_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, "Passwort erfolgreich geändert")
-        self.assertContains(response, "✅")
-        self.assertContains(response, "Jetzt anmelden")
+        self.assertAllContain(
+            response, "Passwort erfolgreich geändert", "✅", "Jetzt anmelden"
+        )
 
 
-class AccountLockoutTest(TestCase):
-    """Test account lockout functionality using django-axes."""
+class AxesLoginTestMixin:
+    """Shared user and failed-login helpers for the django-axes tests."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
+    login_url = LOGIN_URL
+    # Encoded once; the tests below post the same failed login repeatedly
+    failed_login_body = urlencode({"username": "testuser", "password": "wrongpass"})
+    # The attempt record the test client's logins are counted under
+    attempt = AccessAttempt(username="testuser", ip_address="127.0.0.1")
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Silence axes' per-attempt failure and lockout logging for this class
+        axes_logger = logging.getLogger("axes")
+        cls.addClassCleanup(axes_logger.setLevel, axes_logger.level)
+        axes_logger.setLevel(logging.CRITICAL)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="testuser",
             email="test@example.com",
             password="testpass123",
             role="employee",
         )
-        self.login_url = reverse("accounts:login")
+
+    def post_failed_login(self, **extra):
+        """Post the pre-encoded wrong-password login for testuser."""
+        return self.client.post(
+            self.login_url,
+            self.failed_login_body,
+            content_type="application/x-www-form-urlencoded",
+            **extra,
+        )
+
+
+class AccountLockoutTest(AxesLoginTestMixin, TestCase):
+    """Test failed-attempt tracking with the configured (database) axes handler."""
 
     def test_failed_login_attempts_increase_counter(self):
         """Test that failed login attempts are tracked."""
         # Make 3 failed attempts
         for _ in range(3):
-            response = self.client.post(
-                self.login_url, {"username": "testuser", "password": "wrongpass"}
-            )
+            response = self.post_failed_login()
             self.assertEqual(response.status_code, 200)
 
         # Check that axes recorded the attempts
-        from axes.models import AccessAttempt
+        attempt = AccessAttempt.objects.get(username="testuser")
+        self.assertEqual(attempt.failures_since_start, 3)
 
-        attempts = AccessAttempt.objects.filter(username="testuser")
-        self.assertTrue(attempts.exists())
+    def test_successful_login_resets_attempts(self):
+        """Test that successful login resets failed attempts counter."""
+        # Make some failed attempts
+        for _ in range(2):
+            self.post_failed_login()
+
+        # Now login successfully
+        response = self.client.post(
+            self.login_url, {"username": "testuser", "password": "testpass123"}
+        )
+
+        # Should be successful
+        self.assertEqual(response.status_code, 302)
+
+        # Attempts should be cleared on success due to AXES_RESET_ON_SUCCESS
+        self.assertFalse(AccessAttempt.objects.filter(username="testuser").exists())
+
+
+# CACHES must come first: axes rebuilds its handler as soon as AXES_HANDLER
+# changes, and the cache handler looks up the "axes" cache when built. The
+# lockout tests seed failures straight into the cache instead of posting them.
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "axes": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "axes",
+        },
+    },
+    AXES_CACHE="axes",
+    AXES_HANDLER="axes.handlers.cache.AxesCacheHandler",
+)
+class AccountLockoutCacheHandlerTest(
+    AxesLoginTestMixin, ContentAssertionsMixin, TestCase
+):
+    """Test account lockout functionality using django-axes."""
+
+    def setUp(self):
+        caches["axes"].clear()
+
+    def seed_failed_attempts(self, failures, ip_address="127.0.0.1"):
+        """Record failed logins for testuser directly instead of posting them."""
+        cache = get_cache()
+        attempt = AccessAttempt(username="testuser", ip_address=ip_address)
+        for cache_key in get_client_cache_keys(attempt):
+            cache.set(cache_key, failures)
 
     def test_account_lockout_after_max_attempts(self):
         """Test that account gets locked after maximum failed attempts."""
-        # Make 5 failed attempts (AXES_FAILURE_LIMIT)
-        for i in range(5):
-            response = self.client.post(
-                self.login_url, {"username": "testuser", "password": "wrongpass"}
-            )
-            # First 4 attempts should show normal login form
-            if i < 4:
-                self.assertEqual(response.status_code, 200)
-                self.assertContains(response, "Anmelden")
+        # Seed the first 3 failures, then make attempt 4 over HTTP
+        self.seed_failed_attempts(3)
+        response = self.post_failed_login()
+        # Attempts below the limit should show normal login form
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Anmelden")
+
+        # 5th attempt (AXES_FAILURE_LIMIT) locks the account
+        self.post_failed_login()
 
         # 6th attempt should be locked out with 429 status
-        response = self.client.post(
-            self.login_url, {"username": "testuser", "password": "wrongpass"}
-        )
+        response = self.post_failed_login()
         self.assertEqual(response.status_code, 429)
 
     def test_locked_account_shows_lockout_page(self):
         """Test that locked account shows proper lockout page."""
         # Lock the account first
-        for _ in range(6):
-            self.client.post(
-                self.login_url, {"username": "testuser", "password": "wrongpass"}
-            )
+        self.seed_failed_attempts(6)
 
         # Try to access lockout URL directly
-        lockout_url = reverse("accounts:locked")
+        lockout_url = LOCKED_URL
         response = self.client.get(lockout_url)
 
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, "Konto temporär gesperrt")
-        self.assertContains(response, "🔒")
-        self.assertContains(response, "1 Stunde")
-
-    def test_successful_login_resets_attempts(self):
-        """Test that successful login resets failed attempts counter."""
-        # Make some failed attempts
-        for _ in range(2):
-            self.client.post(
-                self.login_url, {"username": "testuser", "password": "wrongpass"}
-            )
-
-        # Now login successfully
-        response = self.client.post(
-            self.login_url, {"username": "testuser", "password": "testpass123"}
-        )
-
-        # Should be successful
-        self.assertEqual(response.status_code, 302)
-
-        # Check that attempts were reset
-        from axes.models import AccessAttempt
-
-        attempts = AccessAttempt.objects.filter(username="testuser")
-        # Attempts should be cleared on success due to AXES_RESET_ON_SUCCESS
-        self.assertEqual(attempts.count(), 0)
+        self.assertAllContain(response, "Konto temporär gesperrt", "🔒", "1 Stunde")
 
     def test_lockout_parameters_combination(self):
         """Test that lockout uses combination of username and IP."""
         # This tests AXES_LOCKOUT_PARAMETERS = ["username", "ip_address"]
-        # Make failed attempts from same IP with same username
-        for _ in range(5):
-            response = self.client.post(
-                self.login_url,
-                {"username": "testuser", "password": "wrongpass"},
-                REMOTE_ADDR="192.168.1.100",
-            )
+        # Seed the 5 failed attempts (AXES_FAILURE_LIMIT) from one IP
+        self.seed_failed_attempts(5, ip_address="192.168.1.100")
 
         # Should be locked for this username/IP combination
-        response = self.client.post(
-            self.login_url,
-            {"username": "testuser", "password": "wrongpass"},
-            REMOTE_ADDR="192.168.1.100",
-        )
+        response = self.post_failed_login(REMOTE_ADDR="192.168.1.100")
         self.assertEqual(response.status_code, 429)
 
         # Note: Different IP behavior depends on axes configuration and test client
@@ -2068,82 +2296,81 @@ class AccountLockoutTest(TestCase):
         # might not simulate IPs properly
 
 
-class HomeViewAuthenticationTest(TestCase):
+class HomeViewAuthenticationTest(ContentAssertionsMixin, TestCase):
     """Test home view shows different content for authenticated and anonymous users."""
 
-    def setUp(self):
-        self.client = Client()
-        self.employee = User.objects.create_user(
-            username="employee",
-            email="employee@example.com",
-            first_name="Test",
-            last_name="Employee",
-            password="testpass123",
-            role="employee",
-        )
-        self.backoffice = User.objects.create_user(
-            username="backoffice",
-            email="backoffice@example.com",
-            first_name="Back",
-            last_name="Office",
-            password="testpass123",
-            role="backoffice",
+    @classmethod
+    def setUpTestData(cls):
+        # Tests use force_login, so no password is needed; one insert query
+        cls.employee, cls.backoffice = User.objects.bulk_create(
+            [
+                User(
+                    username="employee",
+                    email="employee@example.com",
+                    first_name="Test",
+                    last_name="Employee",
+                    role="employee",
+                ),
+                User(
+                    username="backoffice",
+                    email="backoffice@example.com",
+                    first_name="Back",
+                    last_name="Office",
+                    role="backoffice",
+                ),
+            ]
         )
 
-    def test_home_view_anonymous_user(self):
-        """Test home view for anonymous user shows login section."""
-        url = reverse("home")
-        response = self.client.get(url)
-
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, "Anmelden")
-        self.assertContains(response, "Jetzt anmelden")
-        self.assertNotContains(response, "Willkommen")
-
     def test_home_view_authenticated_employee(self):
         """Test home view for authenticated employee."""
-        self.client.login(username="employee", password="testpass123")
-        url = reverse("home")
+        self.client.force_login(self.employee)
+        url = HOME_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, "Willkommen")
-        self.assertContains(response, "Test Employee")
-        self.assertContains(response, "Mitarbeiter")
-        self.assertContains(response, "Listenansicht")
-        self.assertContains(response, "Neuer Zeiteintrag")
-        self.assertContains(response, "Abmelden")
+        self.assertAllContain(
+            response,
+            "Willkommen",
+            "Test Employee",
+            "Mitarbeiter",
+            "Listenansicht",
+            "Neuer Zeiteintrag",
+            "Abmelden",
+        )
 
     def test_home_view_authenticated_backoffice(self):
         """Test home view for authenticated backoffice user."""
-        self.client.login(username="backoffice", password="testpass123")
-        url = reverse("home")
+        self.client.force_login(self.backoffice)
+        url = HOME_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, "Willkommen")
-        self.assertContains(response, "Back Office")
-        self.assertContains(response, "Backoffice")
-        self.assertContains(response, "Admin-Bereich")
-        self.assertContains(response, "Mitarbeiter anlegen")
-        self.assertContains(response, "Abmelden")
+        self.assertAllContain(
+            response,
+            "Willkommen",
+            "Back Office",
+            "Backoffice",
+            "Admin-Bereich",
+            "Mitarbeiter anlegen",
+            "Abmelden",
+        )
 
     def test_logout_link_functionality(self):
         """Test logout link in home view works correctly."""
-        self.client.login(username="employee", password="testpass123")
+        self.client.force_login(self.employee)
 
         # Access home page to confirm login
-        url = reverse("home")
+        url = HOME_URL
         response = self.client.get(url)
         self.assertContains(response, "Willkommen")
 
         # Click logout link
-        logout_url = reverse("accounts:logout")
+        logout_url = LOGOUT_URL
         response = self.client.post(logout_url)
 
         # Should redirect to login page
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse("accounts:login"))
+        self.assertRedirects(response, LOGIN_URL)
 
         # Access home page again - should show login section
         response = self.client.get(url)
@@ -2151,6 +2378,19 @@ class HomeViewAuthenticationTest(TestCase):
         self.assertNotContains(response, "Willkommen")
 
 
+class HomeViewAnonymousTest(ContentAssertionsMixin, SimpleTestCase):
+    """Test the home view for anonymous users, which needs no database."""
+
+    def test_home_view_anonymous_user(self):
+        """Test home view for anonymous user shows login section."""
+        url = HOME_URL
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertAllContain(response, "Anmelden", "Jetzt anmelden")
+        self.assertNotContains(response, "Willkommen")
+
+
 class VehicleModelTest(TestCase):
     """Test Vehicle model functionality."""
 
@@ -2516,6 +2756,69 @@ class VehicleIntegrationTest(TestCase):
         # But vehicle should still exist
         self.assertTrue(Vehicle.objects.filter(id=self.vehicle.id).exists())
 
+    def test_time_entry_list_vehicle_stats(self):
+        """Test vehicle usage statistics shown on the time entry list."""
+        usages = [
+            # (vehicle, start km, end km, no vehicle used)
+            (self.vehicle, 75000, 75200, False),  # 200 km
+            (self.vehicle, 80000, 80050, False),  # 50 km
+            (self.vehicle, 0, 120, False),  # No start reading, counts 0 km
+            (None, None, None, True),
+            None,  # No vehicle usage recorded
+        ]
+        for day, usage in enumerate(usages, start=1):
+            entry = TimeEntry(
+                user=self.user,
+                date=date(2024, 1, day),
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+                lunch_break_minutes=30,
+                pollution_level=1,
+                created_by=self.user,
+                updated_by=self.user,
+            )
+            entry.save(skip_validation=True)
+            if usage:
+                vehicle, start_km, end_km, no_vehicle_used = usage
+                VehicleUsage.objects.create(
+                    time_entry=entry,
+                    vehicle=vehicle,
+                    start_kilometers=start_km,
+                    end_kilometers=end_km,
+                    no_vehicle_used=no_vehicle_used,
+                )
+
+        self.client.force_login(self.user)
+        response = self.client.get(TIME_ENTRY_LIST_URL)
+
+        self.assertEqual(
+            response.context["vehicle_stats"],
+            {
+                "total_entries": 5,
+                "with_vehicle": 3,
+                "no_vehicle": 1,
+                "unknown": 1,
+                "total_kilometers": 250,
+            },
+        )
+
+        # Same fixture, filtered; invalid filter values are ignored
+        filter_cases = [
+            ({"vehicle": "no_vehicle"}, 1),
+            ({"vehicle": "with_vehicle"}, 3),
+            ({"vehicle": str(self.vehicle.pk)}, 3),
+            ({"date_from": "2024-01-02", "date_to": "2024-01-04"}, 3),
+            ({"vehicle": "with_vehicle", "date_from": "2024-01-03"}, 1),
+            ({"vehicle": "abc", "date_from": "not-a-date"}, 5),
+            ({"date_from": "20240103", "date_to": "2024-W01-1"}, 5),
+        ]
+        for params, expected_count in filter_cases:
+            with self.subTest(params=params):
+                response = self.client.get(TIME_ENTRY_LIST_URL, params)
+                self.assertEqual(
+                    response.context["page_obj"].paginator.count, expected_count
+                )
+
 
 class TimeEntryFormWithVehicleTest(TestCase):
     """Test TimeEntryForm with vehicle tracking functionality (US-C08)."""
@@ -2604,6 +2907,14 @@ class TimeEntryFormWithVehicleTest(TestCase):
         self.assertFalse(form.fields["no_vehicle_used"].initial)
         self.assertEqual(form.fields["vehicle_notes"].initial, "Customer visit")
 
+        # A select_related() instance needs no further queries
+        time_entry = TimeEntry.objects.select_related("vehicleusage__vehicle").get(
+            pk=time_entry.pk
+        )
+        with self.assertNumQueries(0):
+            form = TimeEntryForm(instance=time_entry, user=self.user)
+            self.assertEqual(form.fields["vehicle"].initial, self.vehicle1)
+
     def test_form_with_valid_vehicle_data(self):
         """Test form submission with valid vehicle data."""
         form_data = {
@@ -3042,7 +3353,6 @@ class FuelReceiptViewTests(TestCase):
 
     def setUp(self):
         """Set up test data."""
-        self.client = Client()
         self.user = User.objects.create_user(
             username="testuser",
             email="test@example.com",
@@ -3069,25 +3379,49 @@ class FuelReceiptViewTests(TestCase):
 
     def test_fuel_receipt_list_view_requires_login(self):
         """Test that fuel receipt list requires authentication."""
-        response = self.client.get(reverse("accounts:fuel_receipt_list"))
+        response = self.client.get(FUEL_RECEIPT_LIST_URL)
         self.assertEqual(response.status_code, 302)  # Redirect to login
 
     def test_fuel_receipt_list_view_authenticated(self):
         """Test fuel receipt list view for authenticated user."""
         self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(reverse("accounts:fuel_receipt_list"))
+        response = self.client.get(FUEL_RECEIPT_LIST_URL)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Meine Tankbelege")
 
+    def test_fuel_receipt_list_vehicle_filter_choices(self):
+        """Test vehicle filter lists each active vehicle the user refuelled once."""
+        other_user = User.objects.create_user(username="other", role="employee")
+        other_vehicle = Vehicle.objects.create(
+            license_plate="OTHER-1", make="Test", model="Van", year=2021
+        )
+        FuelReceipt.objects.create(
+            employee=self.user,
+            vehicle=self.vehicle,
+            odometer_reading=50500,
+            receipt_image="second.jpg",
+        )
+        FuelReceipt.objects.create(
+            employee=other_user,
+            vehicle=other_vehicle,
+            odometer_reading=1000,
+            receipt_image="other.jpg",
+        )
+
+        self.client.force_login(self.user)
+        response = self.client.get(FUEL_RECEIPT_LIST_URL)
+
+        self.assertEqual(list(response.context["available_vehicles"]), [self.vehicle])
+
     def test_fuel_receipt_create_view_requires_login(self):
         """Test that fuel receipt create requires authentication."""
-        response = self.client.get(reverse("accounts:fuel_receipt_create"))
+        response = self.client.get(FUEL_RECEIPT_CREATE_URL)
         self.assertEqual(response.status_code, 302)  # Redirect to login
 
     def test_fuel_receipt_create_view_authenticated(self):
         """Test fuel receipt create view for authenticated user."""
         self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(reverse("accounts:fuel_receipt_create"))
+        response = self.client.get(FUEL_RECEIPT_CREATE_URL)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Neuer Tankbeleg")
 
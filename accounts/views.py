@@ -1,10 +1,17 @@
-import hashlib
+import re
 import secrets
+from datetime import date
 
 from django.contrib import messages
 from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Count, Exists, F, OuterRef, Q, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
 from django.shortcuts import redirect, render
+from django.urls import reverse
+from django.views.decorators.cache import never_cache
 from django.views.decorators.csrf import csrf_protect
 from django.views.decorators.http import require_http_methods
 
@@ -13,6 +20,47 @@ from .forms import CreateEmployeeForm, TimeEntryForm, FuelReceiptForm
 from .models import TimeEntry, User, FuelReceipt, Vehicle
 from .permissions import backoffice_required
 
+# Invite tokens come from secrets.token_urlsafe(32): 43 URL-safe characters
+FIRST_LOGIN_TOKEN_RE = re.compile(r"[A-Za-z0-9_-]{1,128}")
+
+# date.fromisoformat also takes compact and week dates (20240115, 2024-W03-1)
+ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+# Rows per page on the time entry list, and the columns each row renders
+TIME_ENTRIES_PER_PAGE = 50
+TIME_ENTRY_LIST_FIELDS = (
+    "date",
+    "start_time",
+    "end_time",
+    "lunch_break_minutes",
+    "pollution_level",
+    "vehicleusage__no_vehicle_used",
+    "vehicleusage__start_kilometers",
+    "vehicleusage__end_kilometers",
+    "vehicleusage__vehicle__license_plate",
+)
+
+# Named vehicle filters on the time entry list
+VEHICLE_FILTERS = {
+    # Entries where no vehicle was used
+    "no_vehicle": {"vehicleusage__no_vehicle_used": True},
+    # Entries with any vehicle
+    "with_vehicle": {
+        "vehicleusage__vehicle__isnull": False,
+        "vehicleusage__no_vehicle_used": False,
+    },
+}
+
+
+def parse_iso_date(value):
+    """Parse a YYYY-MM-DD query parameter, returning None if missing or invalid."""
+    if not value or not ISO_DATE_RE.fullmatch(value):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
 
 def home_view(request):
     """
@@ -25,17 +73,21 @@ def home_view(request):
     return render(request, "accounts/home.html", context)
 
 
+@never_cache
 @require_http_methods(["GET", "POST"])
 @csrf_protect
 def first_login_view(request, token):
     """
     Handle first-time login with token-based password setup.
     """
-    # Hash the token to match stored hash
-    token_hash = hashlib.sha256(token.encode()).hexdigest()
-
     # Find user with matching token
     try:
+        # Don't hash or look up input that can't be an issued token
+        if not FIRST_LOGIN_TOKEN_RE.fullmatch(token):
+            raise User.DoesNotExist
+
+        # Hash the token to match stored hash
+        token_hash = User.hash_first_login_token(token)
         user = User.objects.get(first_login_token=token_hash)
     except User.DoesNotExist:
         messages.error(request, "Ungültiger oder abgelaufener Einladungslink.")
@@ -54,33 +106,43 @@ def first_login_view(request, token):
         password1 = request.POST.get("password1", "")
         password2 = request.POST.get("password2", "")
 
-        # Validation
-        errors = []
-        if len(password1) < 8:
-            errors.append("Das Passwort muss mindestens 8 Zeichen lang sein.")
-
-        if password1 != password2:
-            errors.append("Die Passwörter stimmen nicht überein.")
-
+        # Validation (report the first failed check only)
         if not password1:
-            errors.append("Bitte geben Sie ein Passwort ein.")
+            error = "Bitte geben Sie ein Passwort ein."
+        elif len(password1) < 8:
+            error = "Das Passwort muss mindestens 8 Zeichen lang sein."
+        elif password1 != password2:
+            error = "Die Passwörter stimmen nicht überein."
+        else:
+            error = None
 
-        if errors:
-            for error in errors:
-                messages.error(request, error)
+        if error:
+            messages.error(request, error)
             context = {
                 "user": user,
                 "token": token,
             }
             return render(request, "accounts/first_login.html", context)
 
-        # Set new password and clear token
-        user.set_password(password1)
-        user.first_login_token = None
-        user.save()
+        # Set new password and clear token under a row lock, so a double
+        # submit can't set the password twice: the second one finds the
+        # token already cleared
+        with transaction.atomic():
+            try:
+                user = User.objects.select_for_update().get(
+                    pk=user.pk, first_login_token=token_hash
+                )
+            except User.DoesNotExist:
+                messages.error(request, "Ungültiger oder abgelaufener Einladungslink.")
+                return redirect("admin:login")
 
-        # Log user in (specify backend due to django-axes)
-        login(request, user, backend="django.contrib.auth.backends.ModelBackend")
+            user.set_password(password1)
+            user.first_login_token = None
+            user.save(update_fields=["password", "first_login_token"])
+
+            # Log user in (specify backend due to django-axes); the last_login
+            # update and session rotation commit together with the password
+            login(request, user, backend="django.contrib.auth.backends.ModelBackend")
 
         messages.success(
             request,
@@ -114,7 +176,7 @@ def create_employee_view(request):
 
             # Generate first login token
             token = secrets.token_urlsafe(32)
-            user.first_login_token = hashlib.sha256(token.encode()).hexdigest()
+            user.first_login_token = User.hash_first_login_token(token)
 
             # Save user without usable password
             user.set_unusable_password()
@@ -122,7 +184,7 @@ def create_employee_view(request):
 
             # Generate first login URL (for now just show the token)
             first_login_url = request.build_absolute_uri(
-                f"/accounts/first-login/{token}/"
+                reverse("accounts:first_login", kwargs={"token": token})
             )
 
             messages.success(
@@ -147,88 +209,95 @@ def time_entry_list(request):
     List view for employee's time entries.
     Shows all time entries for the current user, with filtering options.
     """
-    # Get user's time entries with vehicle usage data
-    time_entries = (
-        TimeEntry.objects.filter(user=request.user)
-        .select_related("user")
-        .prefetch_related("vehicleusage__vehicle")
-    )
+    # Collect the user scope and any valid filters into one filter() call
+    filters = {"user": request.user}
 
     # Apply vehicle filtering
     vehicle_filter = request.GET.get("vehicle")
-    if vehicle_filter:
-        if vehicle_filter == "no_vehicle":
-            # Filter for entries where no vehicle was used
-            time_entries = time_entries.filter(vehicleusage__no_vehicle_used=True)
-        elif vehicle_filter == "with_vehicle":
-            # Filter for entries with any vehicle
-            time_entries = time_entries.filter(
-                vehicleusage__vehicle__isnull=False, vehicleusage__no_vehicle_used=False
-            )
-        else:
-            # Filter for specific vehicle ID
-            try:
-                vehicle_id = int(vehicle_filter)
-                time_entries = time_entries.filter(vehicleusage__vehicle_id=vehicle_id)
-            except (ValueError, TypeError):
-                pass  # Invalid vehicle ID, ignore filter
+    if vehicle_filter in VEHICLE_FILTERS:
+        filters.update(VEHICLE_FILTERS[vehicle_filter])
+    elif vehicle_filter:
+        # Filter for specific vehicle ID
+        try:
+            filters["vehicleusage__vehicle_id"] = int(vehicle_filter)
+        except (ValueError, TypeError):
+            pass  # Invalid vehicle ID, ignore filter
 
     # Apply date filtering
     date_from = request.GET.get("date_from")
     date_to = request.GET.get("date_to")
-    if date_from:
-        try:
-            from datetime import datetime
+    # Invalid date formats are ignored
+    parsed_from = parse_iso_date(date_from)
+    if parsed_from:
+        filters["date__gte"] = parsed_from
 
-            parsed_date = datetime.strptime(date_from, "%Y-%m-%d").date()
-            time_entries = time_entries.filter(date__gte=parsed_date)
-        except ValueError:
-            pass  # Invalid date format, ignore filter
+    parsed_to = parse_iso_date(date_to)
+    if parsed_to:
+        filters["date__lte"] = parsed_to
 
-    if date_to:
-        try:
-            from datetime import datetime
-
-            parsed_date = datetime.strptime(date_to, "%Y-%m-%d").date()
-            time_entries = time_entries.filter(date__lte=parsed_date)
-        except ValueError:
-            pass  # Invalid date format, ignore filter
+    # Get the matching entries with vehicle usage data (one-to-one, so JOIN it),
+    # loading only the columns the list renders
+    time_entries = (
+        TimeEntry.objects.filter(**filters)
+        .select_related("vehicleusage__vehicle")
+        .only(*TIME_ENTRY_LIST_FIELDS)
+    )
 
-    # Order by date (newest first)
+    # Order by date (newest first) and only load the requested page
     time_entries = time_entries.order_by("-date")
-
-    # Get available vehicles for filter dropdown
-    from .models import Vehicle
-
-    available_vehicles = Vehicle.objects.filter(is_active=True).order_by(
-        "license_plate"
+    page_obj = Paginator(time_entries, TIME_ENTRIES_PER_PAGE).get_page(
+        request.GET.get("page")
     )
 
-    # Calculate vehicle usage statistics
-    all_entries = TimeEntry.objects.filter(user=request.user).prefetch_related(
-        "vehicleusage__vehicle"
+    # Keep the active filters in the pagination links
+    filter_params = request.GET.copy()
+    filter_params.pop("page", None)
+
+    # Get available vehicles for filter dropdown
+    available_vehicles = (
+        Vehicle.objects.filter(is_active=True)
+        .only(*Vehicle.DROPDOWN_FIELDS)
+        .order_by("license_plate")
     )
-    vehicle_stats = {
-        "total_entries": all_entries.count(),
-        "with_vehicle": all_entries.filter(
-            vehicleusage__vehicle__isnull=False, vehicleusage__no_vehicle_used=False
-        ).count(),
-        "no_vehicle": all_entries.filter(vehicleusage__no_vehicle_used=True).count(),
-        "unknown": all_entries.filter(vehicleusage__isnull=True).count(),
-        "total_kilometers": 0,
-    }
 
-    # Calculate total kilometers driven
-    for entry in all_entries:
-        if (
-            hasattr(entry, "vehicleusage")
-            and entry.vehicleusage
-            and entry.vehicleusage.daily_distance
-        ):
-            vehicle_stats["total_kilometers"] += entry.vehicleusage.daily_distance
+    # Calculate vehicle usage statistics in a single aggregate query. The
+    # stats cards are only rendered alongside entries, so an empty page skips it.
+    # total_kilometers mirrors VehicleUsage.daily_distance: both readings set
+    # (non-zero), a vehicle used, and never negative.
+    vehicle_stats = None
+    if page_obj:
+        vehicle_stats = TimeEntry.objects.filter(user=request.user).aggregate(
+            total_entries=Count("id"),
+            with_vehicle=Count(
+                "id",
+                filter=Q(
+                    vehicleusage__vehicle__isnull=False,
+                    vehicleusage__no_vehicle_used=False,
+                ),
+            ),
+            no_vehicle=Count("id", filter=Q(vehicleusage__no_vehicle_used=True)),
+            unknown=Count("id", filter=Q(vehicleusage__isnull=True)),
+            total_kilometers=Coalesce(
+                Sum(
+                    Greatest(
+                        F("vehicleusage__end_kilometers")
+                        - F("vehicleusage__start_kilometers"),
+                        Value(0),
+                    ),
+                    filter=Q(
+                        vehicleusage__start_kilometers__gt=0,
+                        vehicleusage__end_kilometers__gt=0,
+                        vehicleusage__no_vehicle_used=False,
+                    ),
+                ),
+                0,
+            ),
+        )
 
     context = {
-        "time_entries": time_entries,
+        "time_entries": page_obj,
+        "page_obj": page_obj,
+        "filter_query": filter_params.urlencode(),
         "title": "Meine Zeiteinträge",
         "available_vehicles": available_vehicles,
         "vehicle_stats": vehicle_stats,
@@ -276,14 +345,9 @@ def time_entry_create(request, target_date=None):
         form = TimeEntryForm(user=request.user)
 
         # Pre-fill date if provided from calendar
-        if target_date:
-            try:
-                from datetime import datetime
-
-                parsed_date = datetime.strptime(target_date, "%Y-%m-%d").date()
-                form.fields["date"].initial = parsed_date
-            except ValueError:
-                pass  # Invalid date format, ignore
+        parsed_date = parse_iso_date(target_date)
+        if parsed_date:
+            form.fields["date"].initial = parsed_date
 
     context = {
         "form": form,
@@ -303,7 +367,10 @@ def time_entry_edit(request, entry_id):
     Only allows users to edit their own time entries.
     """
     try:
-        time_entry = TimeEntry.objects.get(pk=entry_id, user=request.user)
+        # The form pre-fills its vehicle fields from the one-to-one usage row
+        time_entry = TimeEntry.objects.select_related("vehicleusage__vehicle").get(
+            pk=entry_id, user=request.user
+        )
     except TimeEntry.DoesNotExist:
         messages.error(request, "Zeiteintrag nicht gefunden oder keine Berechtigung.")
         return redirect("accounts:time_entry_list")
@@ -349,10 +416,15 @@ def time_entry_delete(request, entry_id):
     Only allows users to delete their own time entries.
     """
     try:
-        time_entry = TimeEntry.objects.get(pk=entry_id, user=request.user)
-        date = time_entry.date
+        # Only the date is needed for the message; the collector only needs pk
+        time_entry = TimeEntry.objects.only("id", "date").get(
+            pk=entry_id, user=request.user
+        )
+        entry_date = time_entry.date
         time_entry.delete()
-        messages.success(request, f"Zeiteintrag für {date} wurde erfolgreich gelöscht.")
+        messages.success(
+            request, f"Zeiteintrag für {entry_date} wurde erfolgreich gelöscht."
+        )
     except TimeEntry.DoesNotExist:
         messages.error(request, "Zeiteintrag nicht gefunden oder keine Berechtigung.")
 
@@ -423,9 +495,13 @@ def fuel_receipt_list(request):
     receipts = receipts.order_by("-receipt_date")
 
     # Get available vehicles and status choices for filters
+    # EXISTS instead of JOIN + DISTINCT over every receipt of the employee
+    employee_receipts = FuelReceipt.objects.filter(
+        vehicle=OuterRef("pk"), employee=request.user
+    )
     available_vehicles = Vehicle.objects.filter(
-        is_active=True, fuelreceipt__employee=request.user
-    ).distinct()
+        Exists(employee_receipts), is_active=True
+    ).only(*Vehicle.DROPDOWN_FIELDS)
 
     context = {
         "receipts": receipts,
@@ -486,7 +562,9 @@ def fuel_receipt_edit(request, receipt_id):
     Only allows users to edit their own receipts within 24 hours and pending status.
     """
     try:
-        receipt = FuelReceipt.objects.get(pk=receipt_id, employee=request.user)
+        receipt = FuelReceipt.objects.select_related("vehicle").get(
+            pk=receipt_id, employee=request.user
+        )
     except FuelReceipt.DoesNotExist:
         messages.error(request, "Tankbeleg nicht gefunden oder keine Berechtigung.")
         return redirect("accounts:fuel_receipt_list")
@@ -571,7 +649,9 @@ def fuel_receipt_delete(request, receipt_id):
     Only allows users to delete their own receipts if they're pending and within edit window.
     """
     try:
-        receipt = FuelReceipt.objects.get(pk=receipt_id, employee=request.user)
+        receipt = FuelReceipt.objects.select_related("vehicle").get(
+            pk=receipt_id, employee=request.user
+        )
     except FuelReceipt.DoesNotExist:
         messages.error(request, "Tankbeleg nicht gefunden oder keine Berechtigung.")
         return redirect("accounts:fuel_receipt_list")
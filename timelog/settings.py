@@ -90,6 +90,8 @@ if DATABASE_URL:
         "default": dj_database_url.parse(
             DATABASE_URL,
             conn_max_age=600,
+            # Persistent connections: verify before reuse after a DB restart
+            conn_health_checks=True,
             ssl_require=False,
         )
     }
@@ -218,6 +220,10 @@ if TESTING:
     AUTHENTICATION_BACKENDS = [
         "django.contrib.auth.backends.ModelBackend",
     ]
+    # Fast, insecure hashing keeps password-heavy tests cheap; never use in prod
+    PASSWORD_HASHERS = [
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ]
 else:
     AUTHENTICATION_BACKENDS = [
         "axes.backends.AxesBackend",